@@ -1,11 +1,29 @@
 import asyncio
-from aiogram import Bot, Dispatcher, types
+import contextlib
+import hashlib
+import hmac
+import itertools
+import ssl
+import time
+from decimal import Decimal, InvalidOperation, getcontext
+from typing import NamedTuple
+import aiohttp
+import certifi
+import orjson
+from aiogram import Bot, Dispatcher, __version__ as aiogram_version, types
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.exceptions import TelegramAPIError
 from aiogram.filters.command import Command
 from aiogram.types import BotCommand
-from pybit.unified_trading import HTTP
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import hdrs, web
+from aiohttp.http import SERVER_SOFTWARE
 import logging
 from environs import Env
 
+# Decimal precision for price and quantity arithmetic
+getcontext().prec = 18
+
 # Loading environment variables
 env = Env()
 env.read_env()
@@ -20,19 +38,341 @@ BYBIT_API_SECRET = env.str("API_SECRET")
 TELEGRAM_TOKEN = env.str("TELEGRAM_TOKEN")
 TELEGRAM_CHAT_ID = env.str("TELEGRAM_CHAT_ID")
 SYMBOL = env.str("SYMBOL")
-TARGET_PROFIT_PERCENT = env.float("TARGET_PROFIT_PERCENT")
-AMOUNT = env.float("AMOUNT")
+TARGET_PROFIT_PERCENT = env.decimal("TARGET_PROFIT_PERCENT")
+AMOUNT = env.decimal("AMOUNT")
+
+# Multiplier applied to entry values to get their targets
+TARGET_MULT = Decimal(1) + TARGET_PROFIT_PERCENT / 100
+# Precision target values are rounded to
+TARGET_STEP = Decimal("0.001")
+
+# Webhook settings, long polling is used when WEBHOOK_URL is not set
+WEBHOOK_URL = env.str("WEBHOOK_URL", "")  # Public HTTPS base URL, e.g. https://example.com
+WEBHOOK_PATH = env.str("WEBHOOK_PATH", "/webhook")
+WEBHOOK_SECRET = env.str("WEBHOOK_SECRET", "")
+WEBAPP_HOST = env.str("WEBAPP_HOST", "0.0.0.0")
+WEBAPP_PORT = env.int("WEBAPP_PORT", 8080)
+
+# Telegram message templates
+START_TEXT = (
+    "👋 Hello! I am a trading bot for Bybit.\n"
+    "Available commands:\n"
+    "/trade - open a new position\n"
+    "/status - check the current position"
+)
+STATUS_TEMPLATE = (
+    "📊 Current position:\n"
+    "Trading Pair: {symbol}\n"
+    "Entry Price: {entry_price}\n"
+    "Current Price: {current_price}\n"
+    "Current Profit: {current_profit:.2f}%\n"
+    "Target Profit: {target_profit}%"
+)
+
+
+class SharedConnectorSession(AiohttpSession):
+    """aiogram session that sends Telegram requests through a connector shared with the Bybit client."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.connector = None  # aiohttp.TCPConnector, set in main() once the event loop is running
+
+    async def create_session(self) -> aiohttp.ClientSession:
+        """Returns the HTTP session for Telegram requests, creating it on the shared connector if needed.
+
+        Raises:
+            RuntimeError: If the shared connector has not been set yet.
+        """
+        if self.connector is None:
+            raise RuntimeError("Shared connector is not set, it is created in main()")
+
+        if self._should_reset_connector:
+            await self.close()
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=self.connector,
+                connector_owner=False,
+                headers={hdrs.USER_AGENT: f"{SERVER_SOFTWARE} aiogram/{aiogram_version}"}
+            )
+            self._should_reset_connector = False
+        return self._session
+
 
 # Initialize Telegram bot
-bot = Bot(token=TELEGRAM_TOKEN)
+tg_session = SharedConnectorSession()
+bot = Bot(token=TELEGRAM_TOKEN, session=tg_session)
 dp = Dispatcher()
 
-# Initialize Bybit client
-session = HTTP(
-    testnet=True,  # Change to False for using mainnet
-    api_key=BYBIT_API_KEY,
-    api_secret=BYBIT_API_SECRET
-)
+# Bybit API settings
+BYBIT_REST_URL = "https://api-testnet.bybit.com"  # Change to "https://api.bybit.com" for using mainnet
+BYBIT_RECV_WINDOW = "5000"
+BYBIT_KEEPALIVE_TIMEOUT = 60  # Seconds an idle connection is kept open for reuse
+BYBIT_REQUEST_TIMEOUT = 5  # Seconds
+ORDER_BOOK_CACHE_TTL_NS = 250_000_000  # How long a REST quote is reused, in nanoseconds
+BYBIT_PUBLIC_WS_URL = "wss://stream-testnet.bybit.com/v5/public/spot"  # Change to "wss://stream.bybit.com/v5/public/spot" for using mainnet
+BYBIT_TRADE_WS_URL = "wss://stream-testnet.bybit.com/v5/trade"  # Change to "wss://stream.bybit.com/v5/trade" for using mainnet
+BYBIT_WS_PING_INTERVAL = 20  # Seconds
+BYBIT_WS_MAX_BACKOFF = 30  # Seconds
+CLOSE_RETRY_DELAY = 1  # Seconds to wait after a failed close before retrying, doubled on every failure
+CLOSE_RETRY_MAX_DELAY = 30  # Seconds
+# Errors raised by Bybit calls that are expected on a flaky network
+BYBIT_NETWORK_ERRORS = (aiohttp.ClientError, ConnectionError, asyncio.TimeoutError)
+
+# HMAC keyed with the API secret once, copied for every signature
+_hmac_proto = hmac.new(BYBIT_API_SECRET.encode(), digestmod=hashlib.sha256)
+
+
+def _sign(payload: bytes) -> str:
+    """Signs a payload with the Bybit API secret.
+
+    Args:
+        payload (bytes): The data to sign.
+
+    Returns:
+        str: The hex-encoded HMAC-SHA256 signature.
+    """
+    h = _hmac_proto.copy()
+    h.update(payload)
+    return h.hexdigest()
+
+
+def _dumps(obj) -> str:
+    """Encodes an object as a JSON string with orjson, for aiohttp's send_json."""
+    return orjson.dumps(obj).decode()
+
+
+class Quote(NamedTuple):
+    """The best bid (buy) and ask (sell) prices of the order book."""
+    bid: Decimal
+    ask: Decimal
+
+
+class BybitClient:
+    def __init__(self, on_quote=None):
+        """Initializes the BybitClient class.
+
+        Args:
+            on_quote: Optional function called with (bid, ask) on every order book stream update.
+        """
+        self.http = None  # aiohttp.ClientSession, passed to start() once the event loop is running
+        self.on_quote = on_quote
+        self.order_book_task = None
+        self.trade_task = None
+        self._top_of_book = None  # Quote from the order book stream
+        self._trade_ws = None  # Authenticated trade stream connection
+        self._trade_ready = asyncio.Event()
+        self._pending_orders = {}  # reqId -> asyncio.Future awaiting the order response
+        self._req_ids = itertools.count(1)
+
+    @property
+    def top_of_book(self) -> Quote:
+        """The latest quote from the order book stream, or None while disconnected."""
+        return self._top_of_book
+
+    def start(self, http: aiohttp.ClientSession) -> None:
+        """Starts the order book and trade streams in the background.
+
+        Args:
+            http (aiohttp.ClientSession): The session used for all Bybit REST and WebSocket calls.
+        """
+        self.http = http
+        self.order_book_task = asyncio.create_task(self.stream_order_book())
+        self.trade_task = asyncio.create_task(self.stream_trade())
+
+    async def close(self) -> None:
+        """Stops the order book and trade streams and waits for them to finish."""
+        for task in (self.order_book_task, self.trade_task):
+            if task:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+    async def place_order(self, side: str, qty: Decimal) -> dict:
+        """Places a market order over the authenticated Bybit trade WebSocket.
+
+        Args:
+            side (str): The order side, 'Buy' or 'Sell'.
+            qty (Decimal): The order quantity in the base coin.
+
+        Returns:
+            dict: The order response matched to the request by its reqId.
+        """
+        await asyncio.wait_for(self._trade_ready.wait(), BYBIT_REQUEST_TIMEOUT)
+        ws = self._trade_ws
+        if ws is None:
+            # The trade stream dropped right after it was reported ready
+            raise ConnectionError("Trade stream disconnected")
+
+        req_id = str(next(self._req_ids))
+        future = asyncio.get_running_loop().create_future()
+        self._pending_orders[req_id] = future
+        try:
+            await ws.send_str(orjson.dumps({
+                'reqId': req_id,
+                'header': {
+                    'X-BAPI-TIMESTAMP': str(int(time.time() * 1000)),
+                    'X-BAPI-RECV-WINDOW': BYBIT_RECV_WINDOW
+                },
+                'op': "order.create",
+                'args': [{
+                    'category': "spot",
+                    'symbol': SYMBOL,
+                    'side': side,
+                    'orderType': "MARKET",
+                    'qty': str(qty),
+                    'marketUnit': "baseCoin"
+                }]
+            }).decode())
+            return await asyncio.wait_for(future, BYBIT_REQUEST_TIMEOUT)
+        finally:
+            self._pending_orders.pop(req_id, None)
+
+    async def orderbook(self) -> Quote:
+        """Fetches the top of the order book for the specified trading pair over REST.
+
+        Returns:
+            Quote: The current bid and ask prices.
+        """
+        async with self.http.get(f"{BYBIT_REST_URL}/v5/market/orderbook", params={'category': "spot", 'symbol': SYMBOL}) as resp:
+            response = orjson.loads(await resp.read())
+        bid_price = Decimal(response['result']['b'][0][0])  # Buy price
+        ask_price = Decimal(response['result']['a'][0][0])  # Sell price
+        return Quote(bid_price, ask_price)
+
+    async def _run_stream(self, name: str, url: str, on_open, on_message, on_close) -> None:
+        """Keeps a Bybit WebSocket connection open and dispatches its messages.
+
+        Reconnects with exponential backoff if the connection drops.
+
+        Args:
+            name (str): The stream name used in log messages.
+            url (str): The WebSocket endpoint.
+            on_open: Coroutine function called with the new connection before reading messages.
+            on_message: Function called with every decoded message.
+            on_close: Function called after the connection is lost.
+        """
+        backoff = 1
+        while True:
+            try:
+                async with self.http.ws_connect(url) as ws:
+                    await on_open(ws)
+                    logger.info(f"Connected to the {name} stream")
+                    backoff = 1
+
+                    ping_task = asyncio.create_task(self._ping(ws))
+                    try:
+                        async for msg in ws:
+                            if msg.type == aiohttp.WSMsgType.TEXT:
+                                on_message(orjson.loads(msg.data))
+                    finally:
+                        ping_task.cancel()
+            except Exception as e:
+                logger.error(f"Error in the {name} stream: {e}")
+            finally:
+                on_close()
+
+            logger.warning(f"The {name} stream disconnected, reconnecting in {backoff}s")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, BYBIT_WS_MAX_BACKOFF)
+
+    async def stream_order_book(self) -> None:
+        """Streams the top of the order book over the Bybit public WebSocket.
+
+        Subscribes to the level 1 order book of the selected trading pair and caches the latest
+        bid and ask prices.
+
+        This function runs indefinitely until cancelled.
+        """
+        async def subscribe(ws: aiohttp.ClientWebSocketResponse) -> None:
+            await ws.send_json({'op': 'subscribe', 'args': [f"orderbook.1.{SYMBOL}"]}, dumps=_dumps)
+
+        def reset() -> None:
+            # Do not act on stale prices while disconnected
+            self._top_of_book = None
+
+        await self._run_stream("order book", BYBIT_PUBLIC_WS_URL, subscribe, self._on_order_book_message, reset)
+
+    async def stream_trade(self) -> None:
+        """Keeps an authenticated Bybit trade WebSocket open for placing orders.
+
+        This function runs indefinitely until cancelled.
+        """
+        await self._run_stream("trade", BYBIT_TRADE_WS_URL, self._authenticate, self._on_trade_message,
+                               self._on_trade_close)
+
+    async def _authenticate(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Authenticates a trade WebSocket connection with the API key.
+
+        Args:
+            ws (aiohttp.ClientWebSocketResponse): The trade WebSocket connection.
+
+        Raises:
+            ConnectionError: If Bybit rejects the credentials.
+        """
+        expires = int((time.time() + 10) * 1000)
+        signature = _sign(f"GET/realtime{expires}".encode())
+        await ws.send_json({'op': 'auth', 'args': [BYBIT_API_KEY, expires, signature]}, dumps=_dumps)
+
+        response = await ws.receive_json(loads=orjson.loads, timeout=BYBIT_REQUEST_TIMEOUT)
+        if response.get('retCode') != 0:
+            raise ConnectionError(f"Authentication failed: {response.get('retMsg')}")
+
+        self._trade_ws = ws
+        self._trade_ready.set()
+
+    def _on_trade_message(self, message: dict) -> None:
+        """Resolves the pending order request matching a trade stream response.
+
+        Args:
+            message (dict): The decoded WebSocket message.
+        """
+        future = self._pending_orders.get(message.get('reqId'))
+        if future and not future.done():
+            future.set_result(message)
+
+    def _on_trade_close(self) -> None:
+        """Fails all pending order requests once the trade stream is lost."""
+        self._trade_ready.clear()
+        self._trade_ws = None
+        for future in self._pending_orders.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Trade stream disconnected"))
+
+    def _on_order_book_message(self, message: dict) -> None:
+        """Updates the cached bid and ask prices from an order book stream message.
+
+        Args:
+            message (dict): The decoded WebSocket message.
+        """
+        data = message.get('data')
+        if not data:
+            # Subscription confirmations and pongs carry no order book data
+            return
+
+        bid_price, ask_price = self._top_of_book or (None, None)
+        if data.get('b'):
+            bid_price = Decimal(data['b'][0][0])  # Buy price
+        if data.get('a'):
+            ask_price = Decimal(data['a'][0][0])  # Sell price
+        if bid_price is None or ask_price is None:
+            # Wait until both sides of the book are known
+            return
+        self._top_of_book = Quote(bid_price, ask_price)
+
+        if self.on_quote:
+            self.on_quote(bid_price, ask_price)
+
+    @staticmethod
+    async def _ping(ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Keeps a Bybit WebSocket connection alive by sending periodic pings.
+
+        Args:
+            ws (aiohttp.ClientWebSocketResponse): The WebSocket connection to keep alive.
+        """
+        while True:
+            await asyncio.sleep(BYBIT_WS_PING_INTERVAL)
+            await ws.send_json({'op': 'ping'}, dumps=_dumps)
 
 
 class TradingBot:
@@ -43,6 +383,12 @@ class TradingBot:
         """
         self.active_position = None
         self.monitor_task = None
+        self.bybit = BybitClient(on_quote=self._on_quote)
+        self._close_trigger = asyncio.Event()  # Set by the order book stream once the target price is reached
+        self._last_quote = None  # Last quote fetched over REST
+        self._last_quote_ns = 0  # time.monotonic_ns() of the last REST fetch
+        self._quote_fetch = None  # In-flight REST fetch shared by concurrent get_order_book calls
+        self._position_lock = asyncio.Lock()  # Serializes opening and closing so concurrent commands cannot race
 
     async def open_position(self) -> bool:
         """Opens a new trading position.
@@ -53,41 +399,47 @@ class TradingBot:
         Returns:
             bool: True if the position was opened successfully, False otherwise.
         """
-        try:
-            order_book = await self.get_order_book()
-            response = session.place_order(
-                category="spot",
-                symbol=SYMBOL,
-                side="Buy",
-                orderType="MARKET",
-                qty=str(AMOUNT),
-                marketUnit="baseCoin"
-            )
-
-            if response['retCode'] == 0:
-                order_id = response['result']['orderId']
-                entry_price = order_book.get('ask')
-                target_price = round(entry_price * (1 + TARGET_PROFIT_PERCENT / 100), 3)
-                target_amount = round(AMOUNT * (1 + TARGET_PROFIT_PERCENT / 100), 3)
-
-                self.active_position = {
-                    'order_id': order_id,
-                    'symbol': SYMBOL,
-                    'entry_price': entry_price,
-                    'amount': AMOUNT,
-                    'target_price': target_price,
-                    'target_amount': target_amount
-                }
+        async with self._position_lock:
+            # Another /trade may have opened a position while this one was waiting
+            if self.active_position:
+                logger.warning("Position is already open, not opening another one")
+                return False
+
+            # Get the entry price before buying, so a filled order is never left untracked.
+            # This is the streamed quote while the order book stream is connected.
+            quote = await self.get_order_book()
+            if quote is None:
+                return False
 
-                logger.info(f"New position opened: {self.active_position}")
-
-                # Start monitoring the position
-                self.monitor_task = asyncio.create_task(self.monitor_position())
-
-                return True
-        except Exception as e:
-            logger.error(f"Error while opening position: {e}")
-        return False
+            try:
+                response = await self.bybit.place_order("Buy", AMOUNT)
+
+                if response['retCode'] == 0:
+                    entry_price = quote.ask
+                    order_id = response['data']['orderId']
+                    target_price = self.calculate_target(entry_price)
+                    target_amount = self.calculate_target(AMOUNT)
+
+                    self.active_position = {
+                        'order_id': order_id,
+                        'symbol': SYMBOL,
+                        'entry_price': entry_price,
+                        'amount': AMOUNT,
+                        'target_price': target_price,
+                        'target_amount': target_amount
+                    }
+
+                    logger.info(f"New position opened: {self.active_position}")
+
+                    # Start monitoring the position
+                    self._close_trigger.clear()
+                    self.monitor_task = asyncio.create_task(self.monitor_position())
+
+                    return True
+                logger.error(f"Bybit rejected the buy order: {response['retMsg']}")
+            except BYBIT_NETWORK_ERRORS as e:
+                logger.error(f"Error while opening position: {e}")
+            return False
 
     async def close_position(self) -> bool:
         """Closes the active position.
@@ -98,94 +450,146 @@ class TradingBot:
         Returns:
             bool: True if the position was closed successfully, False otherwise.
         """
-        try:
-            order_book = await self.get_order_book()
-            response = session.place_order(
-                category="spot",
-                symbol=SYMBOL,
-                side="Sell",
-                orderType="MARKET",
-                qty=str(AMOUNT),
-                marketUnit="baseCoin"
-            )
+        async with self._position_lock:
+            # The position may have been closed while this call was waiting
+            if not self.active_position:
+                return False
 
-            if response['retCode'] == 0:
-                bid_price = order_book.get('bid')
-                profit_percentage = ((bid_price / self.active_position['entry_price']) - 1) * 100
-
-                await send_notification(f"✅ Position closed!\n"
-                                        f"Trading Pair: {self.active_position['symbol']}\n"
-                                        f"Profit Percentage: {profit_percentage:.2f}%\n"
-                                        f"Entry Price: {self.active_position['entry_price']}\n"
-                                        f"Target Price: {self.active_position['target_price']}\n"
-                                        f"Exit Price: {bid_price}")
-                logger.info(f"Position closed successfully: {self.active_position}")
-                self.active_position = None
-
-                # Stop monitoring the position
-                if self.monitor_task:
-                    self.monitor_task.cancel()
+            try:
+                quote, response = await self._place_order_with_quote("Sell")
+
+                if response['retCode'] == 0:
+                    if quote is None:
+                        # The position is closed anyway, only the exit price is unknown
+                        logger.error("Sell order placed but the exit price is unavailable")
+                        bid_price, profit_percentage = None, Decimal("NaN")
+                    else:
+                        bid_price = quote.bid
+                        profit_percentage = ((bid_price / self.active_position['entry_price']) - 1) * 100
+
+                    await send_notification(f"✅ Position closed!\n"
+                                            f"Trading Pair: {self.active_position['symbol']}\n"
+                                            f"Profit Percentage: {profit_percentage:.2f}%\n"
+                                            f"Entry Price: {self.active_position['entry_price']}\n"
+                                            f"Target Price: {self.active_position['target_price']}\n"
+                                            f"Exit Price: {bid_price}")
+                    logger.info(f"Position closed successfully: {self.active_position}")
+                    self.active_position = None
+
+                    # Stop monitoring the position, the monitor exits on its own when it closed the position itself
+                    if self.monitor_task and self.monitor_task is not asyncio.current_task():
+                        self.monitor_task.cancel()
+                        with contextlib.suppress(asyncio.CancelledError):
+                            await self.monitor_task
                     self.monitor_task = None
-                return True
-        except Exception as e:
-            logger.error(f"Error while closing position: {e}")
-        return False
+                    return True
+                logger.error(f"Bybit rejected the sell order: {response['retMsg']}")
+            except BYBIT_NETWORK_ERRORS as e:
+                logger.error(f"Error while closing position: {e}")
+            return False
+
+    async def _place_order_with_quote(self, side: str) -> tuple:
+        """Places a market order for the configured amount along with the quote it is priced against.
+
+        Uses the streamed quote when it is available, otherwise fetches the order book over REST
+        concurrently with the order. Only for orders that must go out even without a quote, e.g. closing.
+
+        Args:
+            side (str): The order side, 'Buy' or 'Sell'.
+
+        Returns:
+            tuple: The quote (None if it could not be fetched) and the order response.
+        """
+        quote = self.bybit.top_of_book
+        if quote is not None:
+            return quote, await self.bybit.place_order(side, AMOUNT)
+        return tuple(await asyncio.gather(self.get_order_book(), self.bybit.place_order(side, AMOUNT)))
 
     async def monitor_position(self) -> None:
         """Monitors the active position.
 
-        Continuously checks the current market prices and closes the position if the target price is reached.
+        Waits for the order book stream to report that the target price is reached and closes the position.
 
-        This function runs indefinitely until the position is closed.
+        This function runs until the position is closed.
         """
-        while True:
+        retry_delay = CLOSE_RETRY_DELAY
+        while self.active_position:
+            await self._close_trigger.wait()
+            self._close_trigger.clear()
+
             try:
-                if self.active_position:
-                    order_book = await self.get_order_book()
-                    bid_price = order_book.get('bid')
-                    ask_price = order_book.get('ask')
-
-                    if bid_price is None or ask_price is None:
-                        logger.error("Failed to fetch prices from the order book")
-                        continue
-
-                    # Check if the target price is reached
-                    if bid_price >= self.active_position['target_price']:
-                        # Close the position when the target profit is reached
-                        await self.close_position()
-            except Exception as e:
-                logger.error(f"Error while monitoring position: {e}")
+                # Close the position when the target profit is reached
+                if await self.close_position():
+                    return
+            except Exception:
+                # Expected Bybit errors are handled by close_position, anything else is a bug worth a traceback
+                logger.exception("Unexpected error while closing position")
+
+            # Back off so the quote rate does not set the order rate on a persistent rejection
+            logger.warning(f"Failed to close the position, retrying in {retry_delay}s")
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, CLOSE_RETRY_MAX_DELAY)
 
-            await asyncio.sleep(0.5)
+            # Only retry on a quote at the target received after the delay
+            self._close_trigger.clear()
+
+    def _on_quote(self, bid_price: Decimal, ask_price: Decimal) -> None:
+        """Wakes the position monitor once the bid reaches the target price.
+
+        Args:
+            bid_price (Decimal): The current best bid.
+            ask_price (Decimal): The current best ask.
+        """
+        if self.active_position and bid_price is not None and bid_price >= self.active_position['target_price']:
+            self._close_trigger.set()
 
     @staticmethod
-    def calculate_target(amount: float) -> float:
+    def calculate_target(amount: Decimal) -> Decimal:
         """Calculates the target price based on the profit percentage.
 
         Args:
-            amount (float): The initial amount for calculation (e.g., entry price or amount).
+            amount (Decimal): The initial amount for calculation (e.g., entry price or amount).
 
         Returns:
-            float: The calculated target price based on the target profit percentage.
+            Decimal: The calculated target price based on the target profit percentage.
         """
-        return round(amount * (1 + TARGET_PROFIT_PERCENT / 100), 3)
+        return (amount * TARGET_MULT).quantize(TARGET_STEP)
 
-    @staticmethod
-    async def get_order_book() -> dict:
+    async def get_order_book(self) -> Quote:
         """Fetches the order book for the specified trading pair.
 
-        Retrieves the current bid (buy) and ask (sell) prices from the order book.
+        Returns the quote from the order book stream while it is connected. Otherwise retrieves the
+        current bid (buy) and ask (sell) prices over REST, reusing the last result for up to 250ms.
+
+        Returns:
+            Quote: The current bid and ask prices.
+        """
+        if self.bybit.top_of_book is not None:
+            return self.bybit.top_of_book
+
+        now_ns = time.monotonic_ns()
+        if self._last_quote is not None and now_ns - self._last_quote_ns < ORDER_BOOK_CACHE_TTL_NS:
+            return self._last_quote
+
+        # Concurrent callers share a single request, shielded so one cancelled caller does not cancel it for all
+        if self._quote_fetch is None:
+            self._quote_fetch = asyncio.create_task(self._fetch_order_book())
+        return await asyncio.shield(self._quote_fetch)
+
+    async def _fetch_order_book(self) -> Quote:
+        """Fetches the order book over REST and caches the result.
 
         Returns:
-            dict: A dictionary containing 'bid' and 'ask' prices.
+            Quote: The current bid and ask prices, or None if they could not be fetched.
         """
         try:
-            response = session.get_orderbook(category="spot", symbol=SYMBOL)
-            bid_price = float(response['result']['b'][0][0])  # Buy price
-            ask_price = float(response['result']['a'][0][0])  # Sell price
-            return {'bid': bid_price, 'ask': ask_price}
-        except Exception as e:
+            self._last_quote = await self.bybit.orderbook()
+            self._last_quote_ns = time.monotonic_ns()
+            return self._last_quote
+        except (*BYBIT_NETWORK_ERRORS, KeyError, IndexError, ValueError, InvalidOperation) as e:
             logger.error(f"Error while fetching order book: {e}")
+        finally:
+            self._quote_fetch = None
 
 
 # Bot initialization
@@ -203,24 +607,43 @@ async def send_notification(message: str) -> None:
     try:
         await bot.send_message(chat_id=TELEGRAM_CHAT_ID, text=message)
         logger.info(f"Sent notification to Telegram: {message}")
-    except Exception as e:
+    except TelegramAPIError as e:
         logger.error(f"Error while sending notification to Telegram: {e}")
 
 
 async def start_bot():
-    """Starts the bot and begins polling for new messages."""
-    await dp.start_polling(bot)
+    """Starts the bot and begins receiving new messages.
+
+    Telegram pushes updates to a webhook served by aiohttp when WEBHOOK_URL is set,
+    otherwise the bot falls back to long polling.
+    """
+    if not WEBHOOK_URL:
+        await bot.delete_webhook()
+        await dp.start_polling(bot)
+        return
+
+    await bot.set_webhook(url=f"{WEBHOOK_URL}{WEBHOOK_PATH}", secret_token=WEBHOOK_SECRET or None)
+
+    app = web.Application()
+    SimpleRequestHandler(dispatcher=dp, bot=bot, secret_token=WEBHOOK_SECRET or None).register(app, path=WEBHOOK_PATH)
+    setup_application(app, dp, bot=bot)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, host=WEBAPP_HOST, port=WEBAPP_PORT).start()
+    logger.info(f"Receiving updates via webhook on {WEBAPP_HOST}:{WEBAPP_PORT}{WEBHOOK_PATH}")
+
+    try:
+        # Serve until the bot is stopped
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
 
 
 @dp.message(Command("start"))
 async def start_command(message: types.Message):
     """Handles the /start command."""
-    await message.answer(
-        "👋 Hello! I am a trading bot for Bybit.\n"
-        "Available commands:\n"
-        "/trade - open a new position\n"
-        "/status - check the current position"
-    )
+    await message.answer(START_TEXT, disable_notification=True)
 
 
 @dp.message(Command("status"))
@@ -228,16 +651,22 @@ async def status_command(message: types.Message):
     """Handles the /status command."""
     if trading_bot.active_position:
         order_book = await trading_bot.get_order_book()
-        current_price = order_book.get('bid')
+        if order_book is None:
+            await message.answer("❌ Failed to fetch the current price, try again later")
+            return
+
+        current_price, _ = order_book
         current_profit = ((current_price / trading_bot.active_position['entry_price']) - 1) * 100
 
         await message.answer(
-            f"📊 Current position:\n"
-            f"Trading Pair: {trading_bot.active_position['symbol']}\n"
-            f"Entry Price: {trading_bot.active_position['entry_price']}\n"
-            f"Current Price: {current_price}\n"
-            f"Current Profit: {current_profit:.2f}%\n"
-            f"Target Profit: {TARGET_PROFIT_PERCENT}%"
+            STATUS_TEMPLATE.format_map({
+                'symbol': trading_bot.active_position['symbol'],
+                'entry_price': trading_bot.active_position['entry_price'],
+                'current_price': current_price,
+                'current_profit': current_profit,
+                'target_profit': TARGET_PROFIT_PERCENT
+            }),
+            disable_notification=True
         )
     else:
         await message.answer("❌ No open positions")
@@ -258,6 +687,8 @@ async def trade_command(message: types.Message):
                 f"Entry Price: {trading_bot.active_position['entry_price']}\n"
                 f"Target Price: {trading_bot.active_position['target_price']}"
             )
+        elif trading_bot.active_position:
+            await message.answer("❌ You already have an open position!")
         else:
             await message.answer("❌ Error while opening position")
     except Exception as e:
@@ -281,12 +712,45 @@ async def main():
         logger.error("Missing one or more required environment variables")
         return
 
-    # Set the Telegram bot commands
-    await set_main_menu(bot)
+    # Share one pooled keep-alive connector between Telegram and all Bybit REST and WebSocket calls,
+    # so repeated requests reuse the same TCP/TLS connections and DNS cache
+    shared_connector = aiohttp.TCPConnector(
+        ssl=ssl.create_default_context(cafile=certifi.where()),
+        limit=50,
+        limit_per_host=10,
+        ttl_dns_cache=300,
+        keepalive_timeout=BYBIT_KEEPALIVE_TIMEOUT
+    )
+    tg_session.connector = shared_connector
+    http = aiohttp.ClientSession(
+        connector=shared_connector,
+        connector_owner=False,
+        timeout=aiohttp.ClientTimeout(total=BYBIT_REQUEST_TIMEOUT),
+        headers={'Connection': 'keep-alive'}
+    )
+
+    # Keep the top of the order book up to date and the trade stream open in the background
+    trading_bot.bybit.start(http)
 
-    # Start the bot
-    await start_bot()
+    try:
+        # Set the Telegram bot commands
+        await set_main_menu(bot)
+
+        # Start the bot
+        await start_bot()
+    finally:
+        await trading_bot.bybit.close()
+        await http.close()
+        await tg_session.close()
+        await shared_connector.close()
 
 
 if __name__ == '__main__':
+    # Use the faster libuv-based event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())